@@ -167,13 +167,14 @@ func (btree *Btree[TK, TV]) FindOne(ctx context.Context, key TK, firstItemWithKe
 	if btree.StoreInfo.Count == 0 {
 		return false, nil
 	}
-	// Return current Value if key is same as current Key.
-	if btree.isCurrentItemSelected() {
+	// Return current Value if key is same as current Key. Only applicable if not seeking the first
+	// item with the key, so we don't fetch the current item's node for nothing.
+	if !firstItemWithKey && btree.isCurrentItemSelected() {
 		ci, err := btree.getCurrentItem(ctx)
 		if err != nil {
 			return false, err
 		}
-		if !firstItemWithKey && Compare[TK](ci.Key, key) == 0 {
+		if Compare[TK](ci.Key, key) == 0 {
 			return true, nil
 		}
 	}
@@ -182,8 +183,13 @@ func (btree *Btree[TK, TV]) FindOne(ctx context.Context, key TK, firstItemWithKe
 		return false, err
 	}
 	r, err := node.find(ctx, btree, key, firstItemWithKey)
-	btree.getCurrentItem(ctx)
-	return r, err
+	if err != nil {
+		return false, err
+	}
+	if _, err := btree.getCurrentItem(ctx); err != nil {
+		return false, err
+	}
+	return r, nil
 }
 
 // FindOneWithID is synonymous to FindOne but allows code to supply the Item's ID to identify it.
@@ -597,8 +603,11 @@ func (btree *Btree[TK, TV]) isCurrentItemSelected() bool {
 // pattern and avoids recursion.
 func (btree *Btree[TK, TV]) distribute(ctx context.Context) {
 	for btree.distributeAction.sourceNode != nil {
-		log.Debug(fmt.Sprintf("distribute item with key(%v) of node ID(%v) to left(%v)",
-			btree.distributeAction.item.Key, btree.distributeAction.sourceNode.ID, btree.distributeAction.distributeToLeft))
+		// Check the level first so the message doesn't get formatted in this hot loop when debug logging is off.
+		if log.Default().Enabled(ctx, log.LevelDebug) {
+			log.Debug(fmt.Sprintf("distribute item with key(%v) of node ID(%v) to left(%v)",
+				btree.distributeAction.item.Key, btree.distributeAction.sourceNode.ID, btree.distributeAction.distributeToLeft))
+		}
 		n := btree.distributeAction.sourceNode
 		btree.distributeAction.sourceNode = nil
 		item := btree.distributeAction.item
@@ -618,7 +627,9 @@ func (btree *Btree[TK, TV]) distribute(ctx context.Context) {
 // promote allows a controller(btree.promote)-controllee(node.promote) pattern and avoid recursion.
 func (btree *Btree[TK, TV]) promote(ctx context.Context) {
 	for btree.promoteAction.targetNode != nil {
-		log.Debug(fmt.Sprintf("promote will promote a node with ID %v", btree.promoteAction.targetNode.ID))
+		if log.Default().Enabled(ctx, log.LevelDebug) {
+			log.Debug(fmt.Sprintf("promote will promote a node with ID %v", btree.promoteAction.targetNode.ID))
+		}
 		n := btree.promoteAction.targetNode
 		i := btree.promoteAction.slotIndex
 		btree.promoteAction.targetNode = nil
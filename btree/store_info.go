@@ -1,8 +1,6 @@
 package btree
 
 import (
-	"fmt"
-
 	"github.com/SharedCode/sop"
 )
 
@@ -99,10 +97,10 @@ func NewStoreInfoExt(name string, slotLength int, isUnique bool, isValueDataInNo
 }
 
 func FormatBlobTable(name string) string {
-	return fmt.Sprintf("%s_b", name)
+	return name + "_b"
 }
 func FormatRegistryTable(name string) string {
-	return fmt.Sprintf("%s_r", name)
+	return name + "_r"
 }
 
 func ConvertToBlobTableName(registryTableName string) string {
@@ -124,6 +124,34 @@ func Test_EdgeCases(t *testing.T) {
 	// Add other edge cases unit test(s) here.
 }
 
+// FindOne(k, true) should land on the first duplicate even if current item already has key k.
+func Test_FindOneFirstDuplicate(t *testing.T) {
+	b3 := NewBtree[int, string](false)
+	for i := 0; i < 100; i++ {
+		b3.Add(i, fmt.Sprintf("%d", i))
+		b3.Add(50, fmt.Sprintf("dup %d", i))
+	}
+
+	b3.First()
+	if !b3.FindOne(50, true) {
+		t.Fatalf("FindOne(50, true) failed, got = false, want = true.")
+	}
+	first := b3.GetCurrentValue()
+	// Move to the last duplicate.
+	for b3.Next() && b3.GetCurrentKey() == 50 {
+	}
+	if !b3.Previous() || b3.GetCurrentKey() != 50 || b3.GetCurrentValue() == first {
+		t.Fatalf("Previous() failed, got = %v (%s), want = a later duplicate of 50.", b3.GetCurrentKey(), b3.GetCurrentValue())
+	}
+
+	if !b3.FindOne(50, true) || b3.GetCurrentValue() != first {
+		t.Errorf("FindOne(50, true) failed, got = %s, want = %s.", b3.GetCurrentValue(), first)
+	}
+	if !b3.Previous() || b3.GetCurrentKey() != 49 {
+		t.Errorf("Previous() failed, got = %v, want = 49.", b3.GetCurrentKey())
+	}
+}
+
 func Test_ComplexDataMgmtCases(t *testing.T) {
 	max := 100000
 	fmt.Printf("Btree complex data mgmt tests started(%d items).\n", max)
@@ -55,7 +55,7 @@ func NewBlobStore() BlobStore {
 // GetOne fetches a blob from blob table.
 func (b *blobStore) GetOne(ctx context.Context, blobTable string, blobID sop.UUID, target interface{}) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 	selectStatement := fmt.Sprintf("SELECT node FROM %s.%s WHERE id in (?);", connection.Config.Keyspace, blobTable)
 	qry := connection.Session.Query(selectStatement, gocql.UUID(blobID)).WithContext(ctx)
@@ -75,16 +75,16 @@ func (b *blobStore) GetOne(ctx context.Context, blobTable string, blobID sop.UUI
 // Add blob(s) to the Blob store.
 func (b *blobStore) Add(ctx context.Context, storesblobs ...BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 	for i := range storesblobs {
+		insertStatement := fmt.Sprintf("INSERT INTO %s.%s (id, node) VALUES(?,?);",
+			connection.Config.Keyspace, storesblobs[i].BlobTable)
 		for ii := range storesblobs[i].Blobs {
 			ba, err := Marshaler.Marshal(storesblobs[i].Blobs[ii].Value)
 			if err != nil {
 				return err
 			}
-			insertStatement := fmt.Sprintf("INSERT INTO %s.%s (id, node) VALUES(?,?);",
-				connection.Config.Keyspace, storesblobs[i].BlobTable)
 			qry := connection.Session.Query(insertStatement, gocql.UUID(storesblobs[i].Blobs[ii].Key), ba).WithContext(ctx)
 			if connection.Config.ConsistencyBook.BlobStoreAdd > gocql.Any {
 				qry.Consistency(connection.Config.ConsistencyBook.BlobStoreAdd)
@@ -100,15 +100,15 @@ func (b *blobStore) Add(ctx context.Context, storesblobs ...BlobsPayload[sop.Key
 // Update blob(s) in the Blob store.
 func (b *blobStore) Update(ctx context.Context, storesblobs ...BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 	for i := range storesblobs {
+		updateStatement := fmt.Sprintf("UPDATE %s.%s SET node = ? WHERE id = ?;", connection.Config.Keyspace, storesblobs[i].BlobTable)
 		for ii := range storesblobs[i].Blobs {
 			ba, err := Marshaler.Marshal(storesblobs[i].Blobs[ii].Value)
 			if err != nil {
 				return err
 			}
-			updateStatement := fmt.Sprintf("UPDATE %s.%s SET node = ? WHERE id = ?;", connection.Config.Keyspace, storesblobs[i].BlobTable)
 			qry := connection.Session.Query(updateStatement, ba, gocql.UUID(storesblobs[i].Blobs[ii].Key)).WithContext(ctx)
 			if connection.Config.ConsistencyBook.BlobStoreUpdate > gocql.Any {
 				qry.Consistency(connection.Config.ConsistencyBook.BlobStoreUpdate)
@@ -124,7 +124,7 @@ func (b *blobStore) Update(ctx context.Context, storesblobs ...BlobsPayload[sop.
 // Remove will delete(non-logged) node records from different Blob stores(node tables).
 func (b *blobStore) Remove(ctx context.Context, storesBlobsIDs ...BlobsPayload[sop.UUID]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 	// Delete per blob table the Node "blobs".
 	for _, storeBlobIDs := range storesBlobsIDs {
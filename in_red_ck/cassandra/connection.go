@@ -51,11 +51,18 @@ type ConsistencyBook struct {
 type Connection struct {
 	Session *gocql.Session
 	Config
+	// Transaction log statements, formatted once with the keyspace when connection is opened
+	// as they are used on every transaction commit.
+	tLogInsertStatement string
+	tLogDeleteStatement string
 }
 
 var connection *Connection
 var mux sync.Mutex
 
+// Returned by the Cassandra backed stores when the connection is not open.
+var errConnectionClosed = fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+
 // Returns true if connection instance is valid.
 func IsConnectionInstantiated() bool {
 	return connection != nil
@@ -96,7 +103,9 @@ func OpenConnection(config Config) (*Connection, error) {
 		config.Authenticator = nil
 	}
 	var c = Connection{
-		Config: config,
+		Config:              config,
+		tLogInsertStatement: fmt.Sprintf("INSERT INTO %s.t_log (id, c_f, c_f_p) VALUES(?,?,?);", config.Keyspace),
+		tLogDeleteStatement: fmt.Sprintf("DELETE FROM %s.t_log WHERE id = ?;", config.Keyspace),
 	}
 	s, err := cluster.CreateSession()
 	if err != nil {
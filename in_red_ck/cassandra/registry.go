@@ -21,6 +21,15 @@ type RegistryPayload[T sop.Handle | sop.UUID] struct {
 	IDs []T
 }
 
+// Returns the total number of IDs given a set of registry payloads.
+func GetRegistryPayloadCount[T sop.UUID](payloads []RegistryPayload[T]) int {
+	total := 0
+	for _, p := range payloads {
+		total = total + len(p.IDs)
+	}
+	return total
+}
+
 // Virtual ID registry is essential in our support for all or nothing (sub)feature,
 // which is essential for fault tolerance.
 //
@@ -62,6 +71,29 @@ func SetRegistryCacheDuration(duration time.Duration) {
 	registryCacheDuration = duration
 }
 
+// Maximum number of registry records sent in one Add batch. Each record lands on its own partition,
+// thus, keep it within Cassandra's default "unlogged batch across partitions" warn threshold (10).
+const registryAddBatchSize = 10
+
+// chunkRegistryPayloads splits each registry table's handles into chunks of at most batchSize handles,
+// so a batch never spans more than one table nor more than batchSize records.
+func chunkRegistryPayloads(storesHandles []RegistryPayload[sop.Handle], batchSize int) []RegistryPayload[sop.Handle] {
+	chunks := make([]RegistryPayload[sop.Handle], 0, len(storesHandles))
+	for _, sh := range storesHandles {
+		for i := 0; i < len(sh.IDs); i += batchSize {
+			end := i + batchSize
+			if end > len(sh.IDs) {
+				end = len(sh.IDs)
+			}
+			chunks = append(chunks, RegistryPayload[sop.Handle]{
+				RegistryTable: sh.RegistryTable,
+				IDs:           sh.IDs[i:end],
+			})
+		}
+	}
+	return chunks
+}
+
 // NewRegistry manages the Handle in the store's Cassandra registry table.
 func NewRegistry() Registry {
 	return &registry{
@@ -71,23 +103,28 @@ func NewRegistry() Registry {
 
 func (v *registry) Add(ctx context.Context, storesHandles ...RegistryPayload[sop.Handle]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
-	for _, sh := range storesHandles {
+	// Send the new registry records in bounded (unlogged) batches instead of a round trip per handle.
+	for _, chunk := range chunkRegistryPayloads(storesHandles, registryAddBatchSize) {
 		insertStatement := fmt.Sprintf("INSERT INTO %s.%s (lid, is_idb, p_ida, p_idb, ver, wip_ts, is_del) VALUES(?,?,?,?,?,?,?);",
-			connection.Config.Keyspace, sh.RegistryTable)
-		for _, h := range sh.IDs {
-
-			qry := connection.Session.Query(insertStatement, gocql.UUID(h.LogicalID), h.IsActiveIDB, gocql.UUID(h.PhysicalIDA),
-				gocql.UUID(h.PhysicalIDB), h.Version, h.WorkInProgressTimestamp, h.IsDeleted).WithContext(ctx)
-			if connection.Config.ConsistencyBook.RegistryAdd > gocql.Any {
-				qry.Consistency(connection.Config.ConsistencyBook.RegistryAdd)
-			}
+			connection.Config.Keyspace, chunk.RegistryTable)
+		batch := connection.Session.NewBatch(gocql.UnloggedBatch).WithContext(ctx)
+		if connection.Config.ConsistencyBook.RegistryAdd > gocql.Any {
+			batch.SetConsistency(connection.Config.ConsistencyBook.RegistryAdd)
+		}
+		for _, h := range chunk.IDs {
+			// Add a new registry record.
+			batch.Query(insertStatement, gocql.UUID(h.LogicalID), h.IsActiveIDB, gocql.UUID(h.PhysicalIDA),
+				gocql.UUID(h.PhysicalIDB), h.Version, h.WorkInProgressTimestamp, h.IsDeleted)
+		}
+		if err := connection.Session.ExecuteBatch(batch); err != nil {
+			return err
+		}
+	}
 
-			// Add a new store record.
-			if err := qry.Exec(); err != nil {
-				return err
-			}
+	for _, sh := range storesHandles {
+		for _, h := range sh.IDs {
 			// Tolerate Redis cache failure.
 			if err := v.redisCache.SetStruct(ctx, h.LogicalID.String(), &h, registryCacheDuration); err != nil {
 				log.Error("Registry Add (redis setstruct) failed, details: %v", err)
@@ -100,7 +137,7 @@ func (v *registry) Add(ctx context.Context, storesHandles ...RegistryPayload[sop
 // Update does an all or nothing update of the batch of handles, mapping them to respective registry table(s).
 func (v *registry) Update(ctx context.Context, allOrNothing bool, storesHandles ...RegistryPayload[sop.Handle]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 	if len(storesHandles) == 0 {
 		return nil
@@ -183,34 +220,26 @@ func (v *registry) Update(ctx context.Context, allOrNothing bool, storesHandles
 
 func (v *registry) Get(ctx context.Context, storesLids ...RegistryPayload[sop.UUID]) ([]RegistryPayload[sop.Handle], error) {
 	if connection == nil {
-		return nil, fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return nil, errConnectionClosed
 	}
 
 	storesHandles := make([]RegistryPayload[sop.Handle], 0, len(storesLids))
 	for _, storeLids := range storesLids {
-		handles := make([]sop.Handle, 0, len(storeLids.IDs))
-		paramQ := make([]string, 0, len(storeLids.IDs))
-		lidsAsIntfs := make([]interface{}, 0, len(storeLids.IDs))
-		for i := range storeLids.IDs {
-			h := sop.Handle{}
-			if err := v.redisCache.GetStruct(ctx, storeLids.IDs[i].String(), &h); err != nil {
-				if !redis.KeyNotFound(err) {
-					log.Error("Registry Get (redis getstruct) failed, details: %v", err)
-				}
-				paramQ = append(paramQ, "?")
-				lidsAsIntfs = append(lidsAsIntfs, interface{}(gocql.UUID(storeLids.IDs[i])))
-				continue
-			}
-			handles = append(handles, h)
-		}
-
-		if len(paramQ) == 0 {
+		handles, missingLids := v.getCachedHandles(ctx, storeLids.IDs)
+		if len(missingLids) == 0 {
 			storesHandles = append(storesHandles, RegistryPayload[sop.Handle]{
 				RegistryTable: storeLids.RegistryTable,
 				IDs:           handles,
 			})
 			continue
 		}
+		// Handles not found in Redis or errored fetching them, fetch from Cassandra.
+		paramQ := make([]string, len(missingLids))
+		lidsAsIntfs := make([]interface{}, len(missingLids))
+		for i := range missingLids {
+			paramQ[i] = "?"
+			lidsAsIntfs[i] = interface{}(gocql.UUID(missingLids[i]))
+		}
 		selectStatement := fmt.Sprintf("SELECT lid, is_idb, p_ida, p_idb, ver, wip_ts, is_del FROM %s.%s WHERE lid in (%v);",
 			connection.Config.Keyspace, storeLids.RegistryTable, strings.Join(paramQ, ", "))
 
@@ -244,9 +273,35 @@ func (v *registry) Get(ctx context.Context, storesLids ...RegistryPayload[sop.UU
 	return storesHandles, nil
 }
 
+// getCachedHandles fetches the handles from Redis in one round trip. Returns the handles found and
+// the IDs of the handles not found (or that failed to get fetched) which need to be read from Cassandra.
+func (v *registry) getCachedHandles(ctx context.Context, lids []sop.UUID) ([]sop.Handle, []sop.UUID) {
+	keys := make([]string, len(lids))
+	cachedHandles := make([]sop.Handle, len(lids))
+	targets := make([]interface{}, len(lids))
+	for i := range lids {
+		keys[i] = lids[i].String()
+		targets[i] = &cachedHandles[i]
+	}
+	found, err := v.redisCache.GetStructs(ctx, keys, targets)
+	if err != nil {
+		log.Error(fmt.Sprintf("Registry Get (redis getstructs) failed, details: %v", err))
+	}
+	handles := make([]sop.Handle, 0, len(lids))
+	var missingLids []sop.UUID
+	for i := range lids {
+		if !found[i] {
+			missingLids = append(missingLids, lids[i])
+			continue
+		}
+		handles = append(handles, cachedHandles[i])
+	}
+	return handles, missingLids
+}
+
 func (v *registry) Remove(ctx context.Context, storesLids ...RegistryPayload[sop.UUID]) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 
 	for _, storeLids := range storesLids {
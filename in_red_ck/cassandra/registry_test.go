@@ -0,0 +1,77 @@
+package cassandra
+
+import (
+	"context"
+	"testing"
+	"time"
+
+	"github.com/SharedCode/sop"
+	"github.com/SharedCode/sop/in_red_ck/redis"
+)
+
+func newHandles(count int) []sop.Handle {
+	handles := make([]sop.Handle, count)
+	for i := range handles {
+		handles[i] = sop.NewHandle(sop.NewUUID())
+	}
+	return handles
+}
+
+func TestChunkRegistryPayloads(t *testing.T) {
+	payloads := []RegistryPayload[sop.Handle]{
+		{RegistryTable: "foo_r", IDs: newHandles(25)},
+		{RegistryTable: "bar_r", IDs: newHandles(3)},
+		{RegistryTable: "empty_r"},
+		{RegistryTable: "baz_r", IDs: newHandles(10)},
+	}
+	chunks := chunkRegistryPayloads(payloads, registryAddBatchSize)
+
+	wantTables := []string{"foo_r", "foo_r", "foo_r", "bar_r", "baz_r"}
+	wantSizes := []int{10, 10, 5, 3, 10}
+	if len(chunks) != len(wantTables) {
+		t.Fatalf("chunkRegistryPayloads got %d chunks, want %d.", len(chunks), len(wantTables))
+	}
+	for i, c := range chunks {
+		if c.RegistryTable != wantTables[i] || len(c.IDs) != wantSizes[i] {
+			t.Errorf("chunk #%d got (%s, %d), want (%s, %d).", i, c.RegistryTable, len(c.IDs), wantTables[i], wantSizes[i])
+		}
+	}
+
+	// All handles are kept, in order, per table.
+	i := 0
+	for _, c := range chunks[:3] {
+		for _, h := range c.IDs {
+			if h.LogicalID != payloads[0].IDs[i].LogicalID {
+				t.Fatalf("chunk handle #%d got %v, want %v.", i, h.LogicalID, payloads[0].IDs[i].LogicalID)
+			}
+			i++
+		}
+	}
+}
+
+func TestGetCachedHandles(t *testing.T) {
+	ctx := context.Background()
+	cache := redis.NewMockClient()
+	v := &registry{redisCache: cache}
+
+	handles := newHandles(3)
+	cache.SetStruct(ctx, handles[0].LogicalID.String(), &handles[0], time.Minute)
+	// handles[1] is not in Redis and handles[2] is stored as something that can't be decoded to a Handle.
+	cache.SetStruct(ctx, handles[2].LogicalID.String(), "not a handle", time.Minute)
+
+	lids := []sop.UUID{handles[0].LogicalID, handles[1].LogicalID, handles[2].LogicalID}
+	found, missing := v.getCachedHandles(ctx, lids)
+
+	if len(found) != 1 || found[0].LogicalID != handles[0].LogicalID || found[0].PhysicalIDA != handles[0].PhysicalIDA {
+		t.Errorf("getCachedHandles found got = %v, want = [%v].", found, handles[0])
+	}
+	// Both missing and undecodable handles are read from Cassandra.
+	if len(missing) != 2 || missing[0] != handles[1].LogicalID || missing[1] != handles[2].LogicalID {
+		t.Errorf("getCachedHandles missing got = %v, want = [%v %v].", missing, handles[1].LogicalID, handles[2].LogicalID)
+	}
+
+	found, missing = v.getCachedHandles(ctx, lids[:1])
+	if len(found) != 1 || len(missing) != 0 {
+		t.Errorf("getCachedHandles got(found, missing) = %d, %d, want = 1, 0.", len(found), len(missing))
+	}
+}
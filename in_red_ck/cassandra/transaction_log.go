@@ -101,7 +101,7 @@ func (tl *transactionLog) GetLogsDetails(ctx context.Context, hour string) (gocq
 		return NilUUID, nil, nil
 	}
 	if connection == nil {
-		return NilUUID, nil, fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return NilUUID, nil, errConnectionClosed
 	}
 
 	t, err := time.Parse(DateHourLayout, hour)
@@ -149,7 +149,7 @@ func (tl *transactionLog) getOne(ctx context.Context) (string, gocql.UUID, error
 	cappedHourTID := gocql.UUIDFromTime(cappedHour)
 
 	if connection == nil {
-		return "", NilUUID, fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return "", NilUUID, errConnectionClosed
 	}
 
 	selectStatement := fmt.Sprintf("SELECT id FROM %s.t_log WHERE id < ? LIMIT 1 ALLOW FILTERING;", connection.Config.Keyspace)
@@ -167,7 +167,7 @@ func (tl *transactionLog) getOne(ctx context.Context) (string, gocql.UUID, error
 
 func (tl *transactionLog) getLogsDetails(ctx context.Context, tid gocql.UUID) ([]sop.KeyValuePair[int, []byte], error) {
 	if connection == nil {
-		return nil, fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return nil, errConnectionClosed
 	}
 
 	selectStatement := fmt.Sprintf("SELECT c_f, c_f_p FROM %s.t_log WHERE id = ?;", connection.Config.Keyspace)
@@ -192,11 +192,10 @@ func (tl *transactionLog) getLogsDetails(ctx context.Context, tid gocql.UUID) ([
 // Add blob(s) to the Blob store.
 func (tl *transactionLog) Add(ctx context.Context, tid gocql.UUID, commitFunction int, payload []byte) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 
-	insertStatement := fmt.Sprintf("INSERT INTO %s.t_log (id, c_f, c_f_p) VALUES(?,?,?);", connection.Config.Keyspace)
-	qry := connection.Session.Query(insertStatement, tid, commitFunction, payload).WithContext(ctx).Consistency(gocql.LocalOne)
+	qry := connection.Session.Query(connection.tLogInsertStatement, tid, commitFunction, payload).WithContext(ctx).Consistency(gocql.LocalOne)
 	if err := qry.Exec(); err != nil {
 		return err
 	}
@@ -206,11 +205,10 @@ func (tl *transactionLog) Add(ctx context.Context, tid gocql.UUID, commitFunctio
 // Remove will delete transaction log(t_log) records given a transaction ID(tid).
 func (tl *transactionLog) Remove(ctx context.Context, tid gocql.UUID) error {
 	if connection == nil {
-		return fmt.Errorf("Cassandra connection is closed, 'call OpenConnection(config) to open it")
+		return errConnectionClosed
 	}
 
-	deleteStatement := fmt.Sprintf("DELETE FROM %s.t_log WHERE id = ?;", connection.Config.Keyspace)
-	qry := connection.Session.Query(deleteStatement, tid).WithContext(ctx).Consistency(gocql.LocalOne)
+	qry := connection.Session.Query(connection.tLogDeleteStatement, tid).WithContext(ctx).Consistency(gocql.LocalOne)
 	if err := qry.Exec(); err != nil {
 		return err
 	}
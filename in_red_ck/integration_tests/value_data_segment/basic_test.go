@@ -2,6 +2,8 @@ package value_data_segment
 
 import (
 	"context"
+	"fmt"
+	"os"
 	"testing"
 
 	"github.com/SharedCode/sop"
@@ -21,8 +23,16 @@ var redisConfig = redis.Options{
 	DefaultDurationInSeconds: 24 * 60 * 60,
 }
 
-func init() {
-	in_red_ck.Initialize(cassConfig, redisConfig)
+// TestMain opens the Cassandra & Redis connections only when tests are actually run (not on
+// package load) and fails fast if they can't be opened.
+func TestMain(m *testing.M) {
+	if err := in_red_ck.Initialize(cassConfig, redisConfig); err != nil {
+		fmt.Fprintf(os.Stderr, "unable to initialize Cassandra and/or Redis connections, details: %v\n", err)
+		os.Exit(1)
+	}
+	code := m.Run()
+	in_red_ck.Shutdown()
+	os.Exit(code)
 }
 
 var ctx = context.Background()
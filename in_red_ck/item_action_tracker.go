@@ -76,7 +76,8 @@ func (t *itemActionTracker[TK, TV]) Get(ctx context.Context, item *btree.Item[TK
 		if item.Value == nil && item.ValueNeedsFetch {
 			var v TV
 			if t.storeInfo.IsValueDataGloballyCached {
-				if err := t.redisCache.GetStruct(ctx, formatItemKey(item.ID.String()), &v); err != nil {
+				itemKey := formatItemKey(item.ID.String())
+				if err := t.redisCache.GetStruct(ctx, itemKey, &v); err != nil {
 					if !redis.KeyNotFound(err) {
 						log.Error(err.Error())
 					}
@@ -85,7 +86,7 @@ func (t *itemActionTracker[TK, TV]) Get(ctx context.Context, item *btree.Item[TK
 						return err
 					}
 					// Just log Redis error since it is just secondary.
-					if err := t.redisCache.SetStruct(ctx, formatItemKey(item.ID.String()), &v, nodeCacheDuration); err != nil {
+					if err := t.redisCache.SetStruct(ctx, itemKey, &v, nodeCacheDuration); err != nil {
 						log.Error(err.Error())
 					}
 				}
@@ -137,7 +138,11 @@ func (t *itemActionTracker[TK, TV]) Add(ctx context.Context, item *btree.Item[TK
 		}
 		if len(itemsForAdd.Blobs) > 0 {
 			// Log so on crash it can get cleaned up.
-			if err := t.tlogger.log(ctx, addActivelyPersistedItem, extractRequestPayloadIDs(&itemsForAdd)); err != nil {
+			ba, err := extractRequestPayloadIDs(&itemsForAdd)
+			if err != nil {
+				return err
+			}
+			if err := t.tlogger.log(ctx, addActivelyPersistedItem, ba); err != nil {
 				return err
 			}
 			if err := t.blobStore.Add(ctx, itemsForAdd); err != nil {
@@ -168,7 +173,11 @@ func (t *itemActionTracker[TK, TV]) Update(ctx context.Context, item *btree.Item
 			}
 			if len(itemsForAdd.Blobs) > 0 {
 				// Log so on crash it can get cleaned up.
-				if err := t.tlogger.log(ctx, updateActivelyPersistedItem, extractRequestPayloadIDs(&itemsForAdd)); err != nil {
+				ba, err := extractRequestPayloadIDs(&itemsForAdd)
+				if err != nil {
+					return err
+				}
+				if err := t.tlogger.log(ctx, updateActivelyPersistedItem, ba); err != nil {
 					return err
 				}
 				if err := t.blobStore.Add(ctx, itemsForAdd); err != nil {
@@ -231,7 +240,7 @@ func (t *itemActionTracker[TK, TV]) Remove(ctx context.Context, item *btree.Item
 	return nil
 }
 
-func extractRequestPayloadIDs(payload *cas.BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]) []byte {
+func extractRequestPayloadIDs(payload *cas.BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]) ([]byte, error) {
 	var r cas.BlobsPayload[sop.UUID]
 	r.BlobTable = payload.BlobTable
 	r.Blobs = make([]sop.UUID, len(payload.Blobs))
@@ -277,16 +286,17 @@ func (t *itemActionTracker[TK, TV]) lock(ctx context.Context, duration time.Dura
 			continue
 		}
 		var readItem lockRecord
-		if err := t.redisCache.GetStruct(ctx, redis.FormatLockKey(uuid.String()), &readItem); err != nil {
+		lockKey := redis.FormatLockKey(uuid.String())
+		if err := t.redisCache.GetStruct(ctx, lockKey, &readItem); err != nil {
 			if !redis.KeyNotFound(err) {
 				return err
 			}
 			// Item does not exist, upsert it.
-			if err := t.redisCache.SetStruct(ctx, redis.FormatLockKey(uuid.String()), &(cachedItem.lockRecord), duration); err != nil {
+			if err := t.redisCache.SetStruct(ctx, lockKey, &(cachedItem.lockRecord), duration); err != nil {
 				return err
 			}
 			// Use a 2nd "get" to ensure we "won" the lock attempt & fail if not.
-			if err := t.redisCache.GetStruct(ctx, redis.FormatLockKey(uuid.String()), &readItem); err != nil {
+			if err := t.redisCache.GetStruct(ctx, lockKey, &readItem); err != nil {
 				return err
 			} else if readItem.LockID != cachedItem.LockID {
 				if readItem.Action == getAction && cachedItem.Action == getAction {
@@ -317,7 +327,7 @@ func (t *itemActionTracker[TK, TV]) lock(ctx context.Context, duration time.Dura
 
 // unlock will attempt to unlock or delete all tracked items from redis.
 func (t *itemActionTracker[TK, TV]) unlock(ctx context.Context) error {
-	var lastErr error
+	keys := make([]string, 0, len(t.items))
 	for uuid, cachedItem := range t.items {
 		if cachedItem.Action == addAction {
 			continue
@@ -325,9 +335,11 @@ func (t *itemActionTracker[TK, TV]) unlock(ctx context.Context) error {
 		if !cachedItem.isLockOwner {
 			continue
 		}
-		if err := t.redisCache.Delete(ctx, redis.FormatLockKey(uuid.String())); err != nil {
-			lastErr = err
-		}
+		keys = append(keys, redis.FormatLockKey(uuid.String()))
+	}
+	if len(keys) == 0 {
+		return nil
 	}
-	return lastErr
+	// Delete all the lock keys we own in one call.
+	return t.redisCache.Delete(ctx, keys...)
 }
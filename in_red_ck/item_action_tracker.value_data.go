@@ -2,7 +2,6 @@ package in_red_ck
 
 import (
 	"context"
-	"fmt"
 
 	"github.com/SharedCode/sop"
 	cas "github.com/SharedCode/sop/in_red_ck/cassandra"
@@ -14,7 +13,7 @@ func (t *itemActionTracker[TK, TV]) commitTrackedItemsValues(ctx context.Context
 	}
 	itemsForAdd := cas.BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]{
 		BlobTable: t.storeInfo.BlobTable,
-		Blobs:     make([]sop.KeyValuePair[sop.UUID, interface{}], 0, 5),
+		Blobs:     make([]sop.KeyValuePair[sop.UUID, interface{}], 0, len(t.items)),
 	}
 	for uuid, cachedItem := range t.items {
 		itemForAdd := t.manage(uuid, cachedItem)
@@ -79,7 +78,7 @@ func (t *itemActionTracker[TK, TV]) getForRollbackTrackedItemsValues() *cas.Blob
 	}
 	itemsForDelete = cas.BlobsPayload[sop.UUID]{
 		BlobTable: t.storeInfo.BlobTable,
-		Blobs:     make([]sop.UUID, 0, 5),
+		Blobs:     make([]sop.UUID, 0, len(t.items)),
 	}
 	for itemID, cachedItem := range t.items {
 		if cachedItem.Action == addAction || cachedItem.Action == updateAction {
@@ -99,13 +98,13 @@ func (t *itemActionTracker[TK, TV]) getObsoleteTrackedItemsValues() *cas.BlobsPa
 	}
 	itemsForDelete := cas.BlobsPayload[sop.UUID]{
 		BlobTable: t.storeInfo.BlobTable,
-		Blobs:     make([]sop.UUID, 0, 5),
+		Blobs:     make([]sop.UUID, len(t.forDeletionItems)),
 	}
-	itemsForDelete.Blobs = append(itemsForDelete.Blobs, t.forDeletionItems...)
+	copy(itemsForDelete.Blobs, t.forDeletionItems)
 	return &itemsForDelete
 }
 
 // format Item Key for Redis I/O.
 func formatItemKey(k string) string {
-	return fmt.Sprintf("V%s", k)
+	return "V" + k
 }
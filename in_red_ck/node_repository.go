@@ -128,7 +128,8 @@ func (nr *nodeRepository) get(ctx context.Context, logicalID sop.UUID, target in
 		// Use active physical ID if in case different.
 		nodeID = h[0].IDs[0].GetActiveID()
 	}
-	if err := nr.transaction.redisCache.GetStruct(ctx, nr.formatKey(nodeID.String()), target); err != nil {
+	nodeKey := nr.formatKey(nodeID.String())
+	if err := nr.transaction.redisCache.GetStruct(ctx, nodeKey, target); err != nil {
 		if !redis.KeyNotFound(err) {
 			return nil, err
 		}
@@ -137,7 +138,7 @@ func (nr *nodeRepository) get(ctx context.Context, logicalID sop.UUID, target in
 			return nil, err
 		}
 		target.(btree.MetaDataType).SetVersion(h[0].IDs[0].Version)
-		if err := nr.transaction.redisCache.SetStruct(ctx, nr.formatKey(nodeID.String()), target, nodeCacheDuration); err != nil {
+		if err := nr.transaction.redisCache.SetStruct(ctx, nodeKey, target, nodeCacheDuration); err != nil {
 			log.Warn(fmt.Sprintf("failed to cache in Redis the newly fetched node with ID: %v, details: %v", nodeID, err))
 		}
 		nr.nodeLocalCache[logicalID] = cacheNode{
@@ -220,13 +221,9 @@ func (nr *nodeRepository) commitNewRootNodes(ctx context.Context, nodes []sop.Tu
 	if err := nr.transaction.blobStore.Add(ctx, blobs...); err != nil {
 		return false, err
 	}
-	for i := range nodes {
-		for ii := range nodes[i].Second {
-			if err := nr.transaction.redisCache.SetStruct(ctx, nr.formatKey(handles[i].IDs[ii].GetActiveID().String()),
-				nodes[i].Second[ii], nodeCacheDuration); err != nil {
-				return false, err
-			}
-		}
+	keys, values := nr.toCacheKeysValues(blobs)
+	if err := nr.transaction.redisCache.SetStructs(ctx, keys, values, nodeCacheDuration); err != nil {
+		return false, err
 	}
 	// Add virtual IDs to registry.
 	if err := nr.transaction.registry.Add(ctx, handles...); err != nil {
@@ -284,12 +281,9 @@ func (nr *nodeRepository) commitUpdatedNodes(ctx context.Context, nodes []sop.Tu
 	if err := nr.transaction.blobStore.Add(ctx, blobs...); err != nil {
 		return false, nil, err
 	}
-	for i := range nodes {
-		for ii := range nodes[i].Second {
-			if err := nr.transaction.redisCache.SetStruct(ctx, nr.formatKey(handles[i].IDs[ii].GetInActiveID().String()), nodes[i].Second[ii], nodeCacheDuration); err != nil {
-				return false, nil, err
-			}
-		}
+	keys, values := nr.toCacheKeysValues(blobs)
+	if err := nr.transaction.redisCache.SetStructs(ctx, keys, values, nodeCacheDuration); err != nil {
+		return false, nil, err
 	}
 	return true, handles, nil
 }
@@ -352,12 +346,13 @@ func (nr *nodeRepository) commitAddedNodes(ctx context.Context, nodes []sop.Tupl
 			blobs[i].Blobs[ii].Key = metaData.GetID()
 			blobs[i].Blobs[ii].Value = nodes[i].Second[ii]
 			handles[i].IDs[ii] = h
-			// Add node to Redis cache.
-			if err := nr.transaction.redisCache.SetStruct(ctx, nr.formatKey(metaData.GetID().String()), nodes[i].Second[ii], nodeCacheDuration); err != nil {
-				return err
-			}
 		}
 	}
+	// Add nodes to Redis cache.
+	keys, values := nr.toCacheKeysValues(blobs)
+	if err := nr.transaction.redisCache.SetStructs(ctx, keys, values, nodeCacheDuration); err != nil {
+		return err
+	}
 	// Register virtual IDs(a.k.a. handles).
 	if err := nr.transaction.registry.Add(ctx, handles...); err != nil {
 		return err
@@ -409,16 +404,18 @@ func (nr *nodeRepository) rollbackNewRootNodes(ctx context.Context, rollbackData
 		lastErr = fmt.Errorf("unable to undo new root nodes, %v, error: %v", bibs, err)
 		log.Error(lastErr.Error())
 	}
+	deletedKeys := make([]string, 0, cas.GetRegistryPayloadCount(vids))
 	for i := range vids {
 		for ii := range vids[i].IDs {
-			if err := nr.transaction.redisCache.Delete(ctx, nr.formatKey(vids[i].IDs[ii].String())); err != nil && !redis.KeyNotFound(err) {
-				err = fmt.Errorf("unable to undo new root nodes in redis, error: %v", err)
-				if lastErr == nil {
-					lastErr = err
-				}
-				log.Warn(err.Error())
-			}
+			deletedKeys = append(deletedKeys, nr.formatKey(vids[i].IDs[ii].String()))
+		}
+	}
+	if err := nr.deleteFromCache(ctx, deletedKeys); err != nil {
+		err = fmt.Errorf("unable to undo new root nodes in redis, error: %v", err)
+		if lastErr == nil {
+			lastErr = err
 		}
+		log.Warn(err.Error())
 	}
 	// If we're able to commit roots in registry then they are "ours", we need to unregister.
 	if nr.transaction.logger.committedState > commitNewRootNodes {
@@ -450,16 +447,18 @@ func (nr *nodeRepository) rollbackAddedNodes(ctx context.Context, rollbackData i
 		log.Error(lastErr.Error())
 	}
 	// Remove nodes from Redis cache.
+	deletedKeys := make([]string, 0, cas.GetRegistryPayloadCount(vids))
 	for i := range vids {
 		for ii := range vids[i].IDs {
-			if err := nr.transaction.redisCache.Delete(ctx, nr.formatKey(vids[i].IDs[ii].String())); err != nil && !redis.KeyNotFound(err) {
-				err = fmt.Errorf("unable to undo added nodes in redis, error: %v", err)
-				if lastErr == nil {
-					lastErr = err
-				}
-				log.Warn(err.Error())
-			}
+			deletedKeys = append(deletedKeys, nr.formatKey(vids[i].IDs[ii].String()))
+		}
+	}
+	if err := nr.deleteFromCache(ctx, deletedKeys); err != nil {
+		err = fmt.Errorf("unable to undo added nodes in redis, error: %v", err)
+		if lastErr == nil {
+			lastErr = err
 		}
+		log.Warn(err.Error())
 	}
 	return lastErr
 }
@@ -498,17 +497,19 @@ func (nr *nodeRepository) rollbackUpdatedNodes(ctx context.Context, vids []cas.R
 		log.Error(lastErr.Error())
 	}
 	// Undo changes in redis.
+	deletedKeys := make([]string, 0, cas.GetBlobPayloadCount(blobsIDs))
 	for i := range blobsIDs {
 		for ii := range blobsIDs[i].Blobs {
-			if err = nr.transaction.redisCache.Delete(ctx, nr.formatKey(blobsIDs[i].Blobs[ii].String())); err != nil && !redis.KeyNotFound(err) {
-				err = fmt.Errorf("unable to undo updated nodes in redis, error: %v", err)
-				if lastErr == nil {
-					lastErr = err
-				}
-				log.Warn(err.Error())
-			}
+			deletedKeys = append(deletedKeys, nr.formatKey(blobsIDs[i].Blobs[ii].String()))
 		}
 	}
+	if err = nr.deleteFromCache(ctx, deletedKeys); err != nil {
+		err = fmt.Errorf("unable to undo updated nodes in redis, error: %v", err)
+		if lastErr == nil {
+			lastErr = err
+		}
+		log.Warn(err.Error())
+	}
 	return lastErr
 }
 
@@ -612,6 +613,34 @@ func convertToRegistryRequestPayload(nodes []sop.Tuple[*btree.StoreInfo, []inter
 	return vids
 }
 
+// Returns the Redis cache keys & values of the nodes in the blobs payload, for caching them in one call.
+func (nr *nodeRepository) toCacheKeysValues(blobs []cas.BlobsPayload[sop.KeyValuePair[sop.UUID, interface{}]]) ([]string, []interface{}) {
+	count := 0
+	for i := range blobs {
+		count = count + len(blobs[i].Blobs)
+	}
+	keys := make([]string, 0, count)
+	values := make([]interface{}, 0, count)
+	for i := range blobs {
+		for ii := range blobs[i].Blobs {
+			keys = append(keys, nr.formatKey(blobs[i].Blobs[ii].Key.String()))
+			values = append(values, blobs[i].Blobs[ii].Value)
+		}
+	}
+	return keys, values
+}
+
+// Delete the nodes' cache entries in Redis in one call, not found keys are not treated as an error.
+func (nr *nodeRepository) deleteFromCache(ctx context.Context, keys []string) error {
+	if len(keys) == 0 {
+		return nil
+	}
+	if err := nr.transaction.redisCache.Delete(ctx, keys...); err != nil && !redis.KeyNotFound(err) {
+		return err
+	}
+	return nil
+}
+
 func (nr *nodeRepository) formatKey(k string) string {
-	return fmt.Sprintf("N%s", k)
+	return "N" + k
 }
@@ -21,6 +21,12 @@ type Options struct {
 	DefaultDurationInSeconds int
 	// TLS config.
 	TLSConfig *tls.Config
+	// PoolSize is the maximum number of socket connections kept in the client's connection pool.
+	// Zero uses the Redis client's default (10 connections per available CPU).
+	PoolSize int
+	// MinIdleConns is the minimum number of idle connections kept open in the pool, useful to avoid
+	// paying the connection dial cost on bursts of requests. Zero means no idle connections are kept.
+	MinIdleConns int
 }
 
 // Returns the default duration.
@@ -65,10 +71,13 @@ func OpenConnection(options Options) (*Connection, error) {
 	}
 
 	client := redis.NewClient(&redis.Options{
-		TLSConfig: options.TLSConfig,
-		Addr:      options.Address,
-		Password:  options.Password,
-		DB:        options.DB})
+		TLSConfig:    options.TLSConfig,
+		Addr:         options.Address,
+		Password:     options.Password,
+		DB:           options.DB,
+		PoolSize:     options.PoolSize,
+		MinIdleConns: options.MinIdleConns,
+	})
 
 	c := Connection{
 		Client:  client,
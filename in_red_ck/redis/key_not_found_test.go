@@ -0,0 +1,34 @@
+package redis
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"testing"
+
+	"github.com/redis/go-redis/v9"
+)
+
+// Runs offline, no Redis server needed.
+func TestKeyNotFound(t *testing.T) {
+	tests := []struct {
+		name string
+		err  error
+		want bool
+	}{
+		{"nil error", nil, false},
+		{"redis nil", redis.Nil, true},
+		{"wrapped redis nil", fmt.Errorf("get failed: %w", redis.Nil), true},
+		{"other error", errors.New("x"), false},
+	}
+	for _, tt := range tests {
+		if got := KeyNotFound(tt.err); got != tt.want {
+			t.Errorf("KeyNotFound(%s) got = %v, want = %v.", tt.name, got, tt.want)
+		}
+	}
+
+	var u user
+	if err := NewMockClient().GetStruct(context.Background(), "missing", &u); !KeyNotFound(err) {
+		t.Errorf("KeyNotFound(mock GetStruct on missing key) got = false, want = true, err: %v.", err)
+	}
+}
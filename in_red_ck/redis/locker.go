@@ -17,7 +17,7 @@ type LockKeys struct {
 
 // Add prefix to the lock key so it becomes unique.
 func FormatLockKey(k string) string {
-	return fmt.Sprintf("L%s", k)
+	return "L" + k
 }
 
 // Create a set of lock keys.
@@ -87,16 +87,16 @@ func IsLocked(ctx context.Context, lockKeys ...*LockKeys) error {
 
 // Unlock a set of keys.
 func Unlock(ctx context.Context, lockKeys ...*LockKeys) error {
-	redisCache := NewClient()
-	var lastErr error
+	keys := make([]string, 0, len(lockKeys))
 	for _, lk := range lockKeys {
+		// Delete lock key only if we own it.
 		if !lk.isLockOwner {
 			continue
 		}
-		// Delete lock key if we own it.
-		if err := redisCache.Delete(ctx, lk.key); err != nil {
-			lastErr = err
-		}
+		keys = append(keys, lk.key)
+	}
+	if len(keys) == 0 {
+		return nil
 	}
-	return lastErr
+	return NewClient().Delete(ctx, keys...)
 }
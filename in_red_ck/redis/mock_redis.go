@@ -2,6 +2,7 @@ package redis
 
 import (
 	"context"
+	"fmt"
 	"time"
 
 	"github.com/redis/go-redis/v9"
@@ -40,13 +41,40 @@ func (m *mockRedis) SetStruct(ctx context.Context, key string, value interface{}
 	return nil
 }
 
+func (m *mockRedis) SetStructs(ctx context.Context, keys []string, values []interface{}, expiration time.Duration) error {
+	for i := range keys {
+		if err := m.SetStruct(ctx, keys[i], values[i], expiration); err != nil {
+			return err
+		}
+	}
+	return nil
+}
+
 func (m *mockRedis) GetStruct(ctx context.Context, key string, target interface{}) error {
 	ba, ok := m.lookup[key]
 	if !ok {
 		return redis.Nil
 	}
-	Marshaler.Unmarshal(ba, target)
-	return nil
+	return Marshaler.Unmarshal(ba, target)
+}
+func (m *mockRedis) GetStructs(ctx context.Context, keys []string, targets []interface{}) ([]bool, error) {
+	found := make([]bool, len(keys))
+	if len(keys) != len(targets) {
+		return found, fmt.Errorf("keys(count: %d) and targets(count: %d) should have the same count", len(keys), len(targets))
+	}
+	var lastErr error
+	for i := range keys {
+		ba, ok := m.lookup[keys[i]]
+		if !ok {
+			continue
+		}
+		if err := Marshaler.Unmarshal(ba, targets[i]); err != nil {
+			lastErr = err
+			continue
+		}
+		found[i] = true
+	}
+	return found, lastErr
 }
 func (m *mockRedis) Delete(ctx context.Context, keys ...string) error {
 	var lastErr error
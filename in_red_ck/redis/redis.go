@@ -2,6 +2,7 @@ package redis
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"time"
 
@@ -17,8 +18,13 @@ type Cache interface {
 	Get(ctx context.Context, key string) (string, error)
 	// SetStruct upserts a given object with a key to it.
 	SetStruct(ctx context.Context, key string, value interface{}, expiration time.Duration) error
+	// SetStructs upserts a set of objects with their respective keys in one (pipelined) round trip.
+	SetStructs(ctx context.Context, keys []string, values []interface{}, expiration time.Duration) error
 	// GetStruct fetches a given object given a key.
 	GetStruct(ctx context.Context, key string, target interface{}) error
+	// GetStructs fetches a set of objects given their keys in one round trip, each found object gets
+	// decoded into its respective target. Returned found flags tell which keys were found & decoded.
+	GetStructs(ctx context.Context, keys []string, targets []interface{}) ([]bool, error)
 	// Delete removes the object given a key.
 	Delete(ctx context.Context, keys ...string) error
 	// Ping is a utility function to check if connection is good.
@@ -30,6 +36,9 @@ var Marshaler sop.Marshaler = sop.NewMarshaler()
 
 type client struct{}
 
+// Returned by the client methods when the Redis connection is not open.
+var errConnectionNotOpen = fmt.Errorf("Redis connection is not open, 'can't create new client")
+
 // Checks if Redis connection is open and returns the client interface if it is,
 // otherwise returns an error.
 func NewClient() Cache {
@@ -37,29 +46,23 @@ func NewClient() Cache {
 }
 
 // KeyNotFound will detect whether error signifies key not found by Redis.
+// The Redis "nil" reply is checked through the error chain so it is detected even when wrapped.
 func KeyNotFound(err error) bool {
-	return err == redis.Nil
+	return errors.Is(err, redis.Nil)
 }
 
 // Ping tests connectivity for redis (PONG should be returned)
 func (c client) Ping(ctx context.Context) error {
 	if connection == nil {
-		return fmt.Errorf("Redis connection is not open, 'can't create new client")
-	}
-	pong, err := connection.Client.Ping(ctx).Result()
-	if err != nil {
-		return err
+		return errConnectionNotOpen
 	}
-	fmt.Println(pong, err)
-	// Output: PONG <nil>
-
-	return nil
+	return connection.Client.Ping(ctx).Err()
 }
 
 // Set executes the redis Set command
 func (c client) Set(ctx context.Context, key string, value string, expiration time.Duration) error {
 	if connection == nil {
-		return fmt.Errorf("Redis connection is not open, 'can't create new client")
+		return errConnectionNotOpen
 	}
 	if expiration < 0 {
 		expiration = connection.Options.GetDefaultDuration()
@@ -70,7 +73,7 @@ func (c client) Set(ctx context.Context, key string, value string, expiration ti
 // Get executes the redis Get command
 func (c client) Get(ctx context.Context, key string) (string, error) {
 	if connection == nil {
-		return "", fmt.Errorf("Redis connection is not open, 'can't create new client")
+		return "", errConnectionNotOpen
 	}
 	return connection.Client.Get(ctx, key).Result()
 }
@@ -78,7 +81,7 @@ func (c client) Get(ctx context.Context, key string) (string, error) {
 // SetStruct executes the redis Set command
 func (c client) SetStruct(ctx context.Context, key string, value interface{}, expiration time.Duration) error {
 	if connection == nil {
-		return fmt.Errorf("Redis connection is not open, 'can't create new client")
+		return errConnectionNotOpen
 	}
 	// serialize User object to JSON
 	ba, err := Marshaler.Marshal(value)
@@ -92,28 +95,86 @@ func (c client) SetStruct(ctx context.Context, key string, value interface{}, ex
 	return connection.Client.Set(ctx, key, ba, expiration).Err()
 }
 
+// SetStructs executes the redis Set command for each key/value pair in a single pipeline.
+func (c client) SetStructs(ctx context.Context, keys []string, values []interface{}, expiration time.Duration) error {
+	if connection == nil {
+		return errConnectionNotOpen
+	}
+	if len(keys) != len(values) {
+		return fmt.Errorf("keys(count: %d) and values(count: %d) should have the same count", len(keys), len(values))
+	}
+	if len(keys) == 0 {
+		return nil
+	}
+	if expiration < 0 {
+		expiration = connection.Options.GetDefaultDuration()
+	}
+	_, err := connection.Client.Pipelined(ctx, func(pipe redis.Pipeliner) error {
+		for i := range keys {
+			ba, err := Marshaler.Marshal(values[i])
+			if err != nil {
+				return err
+			}
+			pipe.Set(ctx, keys[i], ba, expiration)
+		}
+		return nil
+	})
+	return err
+}
+
 // GetStruct executes the redis Get command
 func (c client) GetStruct(ctx context.Context, key string, target interface{}) error {
 	if connection == nil {
-		return fmt.Errorf("Redis connection is not open, 'can't create new client")
+		return errConnectionNotOpen
 	}
 	if target == nil {
 		return fmt.Errorf("target can't be nil")
 	}
 	ba, err := connection.Client.Get(ctx, key).Bytes()
-	if err == nil {
-		err = Marshaler.Unmarshal(ba, target)
-	}
-	if err == redis.Nil {
+	if err != nil {
+		// Key not found is reported as is (redis.Nil), see KeyNotFound.
 		return err
 	}
-	return err
+	return Marshaler.Unmarshal(ba, target)
+}
+
+// GetStructs executes the redis MGet command. Error is returned if the call failed or if
+// any of the found objects failed to decode, found flags are always returned.
+func (c client) GetStructs(ctx context.Context, keys []string, targets []interface{}) ([]bool, error) {
+	found := make([]bool, len(keys))
+	if connection == nil {
+		return found, errConnectionNotOpen
+	}
+	if len(keys) != len(targets) {
+		return found, fmt.Errorf("keys(count: %d) and targets(count: %d) should have the same count", len(keys), len(targets))
+	}
+	if len(keys) == 0 {
+		return found, nil
+	}
+	values, err := connection.Client.MGet(ctx, keys...).Result()
+	if err != nil {
+		return found, err
+	}
+	var lastErr error
+	for i := range values {
+		// Key not found is returned as nil.
+		s, ok := values[i].(string)
+		if !ok {
+			continue
+		}
+		if err := Marshaler.Unmarshal([]byte(s), targets[i]); err != nil {
+			lastErr = err
+			continue
+		}
+		found[i] = true
+	}
+	return found, lastErr
 }
 
 // Delete executes the redis Del command
 func (c client) Delete(ctx context.Context, keys ...string) error {
 	if connection == nil {
-		return fmt.Errorf("Redis connection is not open, 'can't create new client")
+		return errConnectionNotOpen
 	}
 	var r = connection.Client.Del(ctx, keys...)
 	return r.Err()
@@ -54,3 +54,52 @@ func TestBasicUse(t *testing.T) {
 		t.Error("Struct foo still exists after delete.")
 	}
 }
+
+func TestMultipleKeysUse(t *testing.T) {
+	option := DefaultOptions()
+	OpenConnection(option)
+	defer CloseConnection()
+
+	c := NewClient()
+	ctx := context.Background()
+
+	keys := []string{"fooBar1", "fooBar2"}
+	values := []interface{}{
+		&user{Username: "foo1", MobileID: 1},
+		&user{Username: "foo2", MobileID: 2},
+	}
+	if err := c.SetStructs(ctx, keys, values, 0); err != nil {
+		t.Errorf(err.Error())
+	}
+	for i := range keys {
+		u := user{}
+		if err := c.GetStruct(ctx, keys[i], &u); err != nil {
+			t.Errorf("Struct %s NOT exists.", keys[i])
+		}
+		if u.MobileID != i+1 {
+			t.Errorf("Struct %s MobileID got = %d, want = %d", keys[i], u.MobileID, i+1)
+		}
+	}
+
+	users := make([]user, len(keys)+1)
+	found, err := c.GetStructs(ctx, append(keys, "fooBarNotFound"), []interface{}{&users[0], &users[1], &users[2]})
+	if err != nil {
+		t.Errorf(err.Error())
+	}
+	if !found[0] || !found[1] || found[2] {
+		t.Errorf("GetStructs found got = %v, want = [true true false]", found)
+	}
+	if users[1].Username != "foo2" {
+		t.Errorf("GetStructs Username got = %s, want = foo2", users[1].Username)
+	}
+
+	if err := c.Delete(ctx, keys...); err != nil {
+		t.Errorf(err.Error())
+	}
+	for i := range keys {
+		u := user{}
+		if err := c.GetStruct(ctx, keys[i], &u); !KeyNotFound(err) {
+			t.Errorf("Struct %s still exists after delete.", keys[i])
+		}
+	}
+}
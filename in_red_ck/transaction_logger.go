@@ -2,7 +2,7 @@ package in_red_ck
 
 import (
 	"context"
-	"encoding/json"
+	"fmt"
 
 	"github.com/SharedCode/sop"
 	"github.com/SharedCode/sop/btree"
@@ -110,12 +110,17 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		return nil
 	}
 
+	// A payload that fails to decode aborts the cleanup and keeps the logs, acting on a partial
+	// view of the transaction (e.g. rolling back a completed commit) is worse than retrying later.
 	var lastErr error
 	lastCommittedFunctionLog := committedFunctionLogs[len(committedFunctionLogs)-1].Key
 	for i := len(committedFunctionLogs) - 1; i >= 0; i-- {
 		// Process pre commit log functions.
 		if committedFunctionLogs[i].Key == addActivelyPersistedItem && committedFunctionLogs[i].Value != nil {
-			itemsForDelete := toStruct[cas.BlobsPayload[sop.UUID]](committedFunctionLogs[i].Value)
+			itemsForDelete, err := toStruct[cas.BlobsPayload[sop.UUID]](committedFunctionLogs[i].Value)
+			if err != nil {
+				return err
+			}
 			if err := t.blobStore.Remove(ctx, itemsForDelete); err != nil {
 				lastErr = err
 			}
@@ -133,7 +138,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 				}
 				continue
 			}
-			v := toStruct[sop.Tuple[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]], []sop.Tuple[bool, cas.BlobsPayload[sop.UUID]]]](committedFunctionLogs[i].Value)
+			v, err := toStruct[sop.Tuple[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]], []sop.Tuple[bool, cas.BlobsPayload[sop.UUID]]]](committedFunctionLogs[i].Value)
+			if err != nil {
+				return err
+			}
 			if lastCommittedFunctionLog == deleteTrackedItemsValues {
 				if err := t.deleteTrackedItemsValues(ctx, v.Second); err != nil {
 					lastErr = err
@@ -152,7 +160,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitStoreInfo {
 			if lastCommittedFunctionLog > commitStoreInfo && committedFunctionLogs[i].Value != nil {
-				sis := toStruct[[]btree.StoreInfo](committedFunctionLogs[i].Value)
+				sis, err := toStruct[[]btree.StoreInfo](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.storeRepository.Update(ctx, sis...); err != nil {
 					lastErr = err
 				}
@@ -161,7 +172,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitAddedNodes {
 			if lastCommittedFunctionLog > commitAddedNodes && committedFunctionLogs[i].Value != nil {
-				bv := toStruct[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				bv, err := toStruct[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.btreesBackend[0].nodeRepository.rollbackAddedNodes(ctx, bv); err != nil {
 					lastErr = err
 				}
@@ -170,7 +184,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitRemovedNodes {
 			if lastCommittedFunctionLog > commitRemovedNodes && committedFunctionLogs[i].Value != nil {
-				vids := toStruct[[]cas.RegistryPayload[sop.UUID]](committedFunctionLogs[i].Value)
+				vids, err := toStruct[[]cas.RegistryPayload[sop.UUID]](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.btreesBackend[0].nodeRepository.rollbackRemovedNodes(ctx, vids); err != nil {
 					lastErr = err
 				}
@@ -179,7 +196,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitUpdatedNodes {
 			if lastCommittedFunctionLog > commitUpdatedNodes && committedFunctionLogs[i].Value != nil {
-				vids := toStruct[[]cas.RegistryPayload[sop.UUID]](committedFunctionLogs[i].Value)
+				vids, err := toStruct[[]cas.RegistryPayload[sop.UUID]](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.btreesBackend[0].nodeRepository.rollbackUpdatedNodes(ctx, vids); err != nil {
 					lastErr = err
 				}
@@ -188,7 +208,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitNewRootNodes {
 			if lastCommittedFunctionLog > commitNewRootNodes && committedFunctionLogs[i].Value != nil {
-				bv := toStruct[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				bv, err := toStruct[sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.btreesBackend[0].nodeRepository.rollbackNewRootNodes(ctx, bv); err != nil {
 					lastErr = err
 				}
@@ -197,7 +220,10 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 		}
 		if committedFunctionLogs[i].Key == commitTrackedItemsValues {
 			if lastCommittedFunctionLog >= commitTrackedItemsValues && committedFunctionLogs[i].Value != nil {
-				ifd := toStruct[[]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				ifd, err := toStruct[[]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]]](committedFunctionLogs[i].Value)
+				if err != nil {
+					return err
+				}
 				if err := t.deleteTrackedItemsValues(ctx, ifd); err != nil {
 					lastErr = err
 				}
@@ -212,16 +238,25 @@ func (tl *transactionLog) processExpiredTransactionLogs(ctx context.Context, t *
 	return lastErr
 }
 
-func toStruct[T any](obj []byte) T {
+// Transaction log payloads are read back by whichever process cleans up expired logs, thus, they
+// use a fixed (JSON) encoding independent of the pluggable blob store Marshaler.
+var transactionLogMarshaler = sop.NewMarshaler()
+
+func toStruct[T any](obj []byte) (T, error) {
 	var t T
 	if obj == nil {
-		return t
+		return t, nil
 	}
-	json.Unmarshal(obj, &t)
-	return t
+	if err := transactionLogMarshaler.Unmarshal(obj, &t); err != nil {
+		return t, fmt.Errorf("failed to decode transaction log payload, details: %v", err)
+	}
+	return t, nil
 }
 
-func toByteArray(obj interface{}) []byte {
-	ba, _ := json.Marshal(obj)
-	return ba
+func toByteArray(obj interface{}) ([]byte, error) {
+	ba, err := transactionLogMarshaler.Marshal(obj)
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode transaction log payload, details: %v", err)
+	}
+	return ba, nil
 }
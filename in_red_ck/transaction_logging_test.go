@@ -5,6 +5,7 @@ import (
 	"time"
 
 	"github.com/SharedCode/sop"
+	"github.com/SharedCode/sop/btree"
 	cas "github.com/SharedCode/sop/in_red_ck/cassandra"
 )
 
@@ -105,3 +106,72 @@ func Test_TLog_FailOnFinalizeCommit(t *testing.T) {
 		t.Errorf("processExpiredTransactionLogs failed, got %v want nil.", err)
 	}
 }
+
+func Test_TLog_PayloadEncoding(t *testing.T) {
+	want := []cas.RegistryPayload[sop.UUID]{{RegistryTable: "foo_r", IDs: []sop.UUID{sop.NewUUID()}}}
+	ba, err := toByteArray(want)
+	if err != nil {
+		t.Fatalf("toByteArray failed, details: %v.", err)
+	}
+	got, err := toStruct[[]cas.RegistryPayload[sop.UUID]](ba)
+	if err != nil {
+		t.Fatalf("toStruct failed, details: %v.", err)
+	}
+	if len(got) != 1 || got[0].RegistryTable != want[0].RegistryTable || got[0].IDs[0] != want[0].IDs[0] {
+		t.Errorf("toStruct got = %v, want = %v.", got, want)
+	}
+
+	if _, err := toStruct[[]cas.RegistryPayload[sop.UUID]]([]byte("not a payload")); err == nil {
+		t.Errorf("toStruct on a corrupt payload got nil, want error.")
+	}
+}
+
+// A completed commit (logged up to deleteTrackedItemsValues) whose finalizeCommit payload is corrupt
+// should not get rolled back nor get its logs removed.
+func Test_TLog_CorruptFinalizeCommitPayload(t *testing.T) {
+	// Unwind time to yesterday.
+	yesterday := time.Now().Add(time.Duration(-24 * time.Hour))
+	cas.Now = func() time.Time { return yesterday }
+	sop.Now = func() time.Time { return yesterday }
+	Now = func() time.Time { return yesterday }
+
+	trans, _ := newMockTransactionWithLogging(t, ForWriting, -1)
+	twoPhaseTrans := trans.GetPhasedTransaction().(*transaction)
+
+	si := *btree.NewStoreInfo("tlogcorrupt", 8, false, false, false, "")
+	si.RootNodeID = sop.NewUUID()
+	twoPhaseTrans.storeRepository.Add(ctx, si)
+
+	// Store info rollback payload, it would revert the root node ID if the commit gets rolled back.
+	rollbackSI := si
+	rollbackSI.RootNodeID = sop.NewUUID()
+	sis, _ := toByteArray([]btree.StoreInfo{rollbackSI})
+
+	tid := twoPhaseTrans.logger.transactionID
+	tlog := twoPhaseTrans.logger.logger
+	tlog.Add(ctx, tid, commitStoreInfo, sis)
+	tlog.Add(ctx, tid, beforeFinalize, nil)
+	tlog.Add(ctx, tid, finalizeCommit, []byte("not a payload"))
+	tlog.Add(ctx, tid, deleteObsoleteEntries, nil)
+	tlog.Add(ctx, tid, deleteTrackedItemsValues, nil)
+
+	// Fast forward by a day to expire the transaction logs.
+	today := time.Now()
+	cas.Now = func() time.Time { return today }
+	sop.Now = func() time.Time { return today }
+	Now = func() time.Time { return today }
+
+	hourBeingProcessed = ""
+	if err := twoPhaseTrans.logger.processExpiredTransactionLogs(ctx, twoPhaseTrans); err == nil {
+		t.Errorf("processExpiredTransactionLogs got nil, want decode error.")
+	}
+	hourBeingProcessed = ""
+
+	stores, _ := twoPhaseTrans.storeRepository.Get(ctx, si.Name)
+	if stores[0].RootNodeID != si.RootNodeID {
+		t.Errorf("Store root node ID got = %s, want = %s, committed transaction got rolled back.", stores[0].RootNodeID.String(), si.RootNodeID.String())
+	}
+	if logs := tlog.(*cas.MockTransactionLog).GetTIDLogs(tid); len(logs) != 5 {
+		t.Errorf("Transaction logs got = %d, want = 5, logs should be kept.", len(logs))
+	}
+}
@@ -287,7 +287,11 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 			return err
 		}
 
-		if err := t.logger.log(ctx, commitTrackedItemsValues, toByteArray(t.getForRollbackTrackedItemsValues())); err != nil {
+		payload, err := toByteArray(t.getForRollbackTrackedItemsValues())
+		if err != nil {
+			return err
+		}
+		if err := t.logger.log(ctx, commitTrackedItemsValues, payload); err != nil {
 			return err
 		}
 		if err := t.commitTrackedItemsValues(ctx); err != nil {
@@ -310,9 +314,13 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 		// Commit new root nodes.
 		bibs := convertToBlobRequestPayload(rootNodes)
 		vids := convertToRegistryRequestPayload(rootNodes)
-		if err := t.logger.log(ctx, commitNewRootNodes, toByteArray(sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]{
+		payload, err = toByteArray(sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]{
 			First: vids, Second: bibs,
-		})); err != nil {
+		})
+		if err != nil {
+			return err
+		}
+		if err := t.logger.log(ctx, commitNewRootNodes, payload); err != nil {
 			return err
 		}
 		if successful, err = t.btreesBackend[0].nodeRepository.commitNewRootNodes(ctx, rootNodes); err != nil {
@@ -330,7 +338,11 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 		}
 		if successful {
 			// Commit updated nodes.
-			if err := t.logger.log(ctx, commitUpdatedNodes, toByteArray(convertToRegistryRequestPayload(updatedNodes))); err != nil {
+			payload, err = toByteArray(convertToRegistryRequestPayload(updatedNodes))
+			if err != nil {
+				return err
+			}
+			if err := t.logger.log(ctx, commitUpdatedNodes, payload); err != nil {
 				return err
 			}
 			if successful, updatedNodesHandles, err = t.btreesBackend[0].nodeRepository.commitUpdatedNodes(ctx, updatedNodes); err != nil {
@@ -340,7 +352,11 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 		// Only do commit removed nodes if successful so far.
 		if successful {
 			// Commit removed nodes.
-			if err := t.logger.log(ctx, commitRemovedNodes, toByteArray(convertToRegistryRequestPayload(removedNodes))); err != nil {
+			payload, err = toByteArray(convertToRegistryRequestPayload(removedNodes))
+			if err != nil {
+				return err
+			}
+			if err := t.logger.log(ctx, commitRemovedNodes, payload); err != nil {
 				return err
 			}
 			if successful, removedNodesHandles, err = t.btreesBackend[0].nodeRepository.commitRemovedNodes(ctx, removedNodes); err != nil {
@@ -368,10 +384,14 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 	}
 
 	// Commit added nodes.
-	if err := t.logger.log(ctx, commitAddedNodes, toByteArray(sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]{
+	payload, err := toByteArray(sop.Tuple[[]cas.RegistryPayload[sop.UUID], []cas.BlobsPayload[sop.UUID]]{
 		First:  convertToRegistryRequestPayload(addedNodes),
 		Second: convertToBlobRequestPayload(addedNodes),
-	})); err != nil {
+	})
+	if err != nil {
+		return err
+	}
+	if err := t.logger.log(ctx, commitAddedNodes, payload); err != nil {
 		return err
 	}
 	if err := t.btreesBackend[0].nodeRepository.commitAddedNodes(ctx, addedNodes); err != nil {
@@ -379,7 +399,11 @@ func (t *transaction) phase1Commit(ctx context.Context) error {
 	}
 
 	// Commit stores update(CountDelta apply).
-	if err := t.logger.log(ctx, commitStoreInfo, toByteArray(t.getRollbackStoresInfo())); err != nil {
+	payload, err = toByteArray(t.getRollbackStoresInfo())
+	if err != nil {
+		return err
+	}
+	if err := t.logger.log(ctx, commitStoreInfo, payload); err != nil {
 		return err
 	}
 	if err := t.commitStores(ctx); err != nil {
@@ -428,7 +452,11 @@ func (t *transaction) phase2Commit(ctx context.Context) error {
 			Second: s,
 		}
 	}
-	if err := t.logger.log(ctx, finalizeCommit, toByteArray(pl)); err != nil {
+	payload, err := toByteArray(pl)
+	if err != nil {
+		return err
+	}
+	if err := t.logger.log(ctx, finalizeCommit, payload); err != nil {
 		return err
 	}
 	if err := t.registry.Update(ctx, true, append(t.updatedNodeHandles, t.removedNodeHandles...)...); err != nil {
@@ -589,7 +617,7 @@ func (t *transaction) commitTrackedItemsValues(ctx context.Context) error {
 	return nil
 }
 func (t *transaction) getForRollbackTrackedItemsValues() []sop.Tuple[bool, cas.BlobsPayload[sop.UUID]] {
-	r := make([]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]], 0, 5)
+	r := make([]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]], 0, len(t.btreesBackend))
 	for i := range t.btreesBackend {
 		itemsForDelete := t.btreesBackend[i].getForRollbackTrackedItemsValues()
 		if itemsForDelete != nil && len(itemsForDelete.Blobs) > 0 {
@@ -602,7 +630,7 @@ func (t *transaction) getForRollbackTrackedItemsValues() []sop.Tuple[bool, cas.B
 	return r
 }
 func (t *transaction) getObsoleteTrackedItemsValues() []sop.Tuple[bool, cas.BlobsPayload[sop.UUID]] {
-	r := make([]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]], 0, 5)
+	r := make([]sop.Tuple[bool, cas.BlobsPayload[sop.UUID]], 0, len(t.btreesBackend))
 	for i := range t.btreesBackend {
 		itemsForDelete := t.btreesBackend[i].getObsoleteTrackedItemsValues()
 		if itemsForDelete != nil && len(itemsForDelete.Blobs) > 0 {
@@ -619,11 +647,14 @@ func (t *transaction) deleteTrackedItemsValues(ctx context.Context, itemsForDele
 	var lastErr error
 	for i := range itemsForDelete {
 		// First field of the Tuple specifies whether we need to delete from Redis cache the blob IDs specified in Second.
-		if itemsForDelete[i].First {
+		if itemsForDelete[i].First && len(itemsForDelete[i].Second.Blobs) > 0 {
+			// Delete all the blobs' cached values in one Redis call.
+			keys := make([]string, len(itemsForDelete[i].Second.Blobs))
 			for ii := range itemsForDelete[i].Second.Blobs {
-				if err := t.redisCache.Delete(ctx, formatItemKey(itemsForDelete[i].Second.Blobs[ii].String())); err != nil {
-					lastErr = err
-				}
+				keys[ii] = formatItemKey(itemsForDelete[i].Second.Blobs[ii].String())
+			}
+			if err := t.redisCache.Delete(ctx, keys...); err != nil {
+				lastErr = err
 			}
 		}
 		if err := t.blobStore.Remove(ctx, itemsForDelete[i].Second); err != nil {
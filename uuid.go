@@ -1,7 +1,6 @@
 package sop
 
 import (
-	"bytes"
 	"time"
 
 	"github.com/google/uuid"
@@ -29,11 +28,28 @@ func NewUUID() UUID {
 	panic(err)
 }
 
+// EnableUUIDRandPool makes NewUUID draw its random bytes from an internal pool that gets filled
+// in batches, instead of reading from the random number generator on every call. This improves
+// UUID generation throughput significantly, e.g. when adding a lot of items or nodes.
+//
+// Security risk: the pooled random bytes are kept on the heap ahead of use, so anything that can
+// read the process' memory (e.g. a memory dump, core file or memory disclosure bug) can learn the
+// UUIDs that will be generated next. Do not enable it if UUIDs are used for anything security
+// sensitive (e.g. as tokens or hard to guess IDs); it is opt-in for this reason.
+//
+// The pool is global to the process (it is the google/uuid package's) and enabling it is not
+// thread-safe, so call it on startup before any UUID gets generated.
+func EnableUUIDRandPool() {
+	uuid.EnableRandPool()
+}
+
 // NillUUID is an empty UUID.
 var NilUUID UUID
 
+// IsNil returns true if UUID is the NilUUID. UUID is a fixed size array, thus, it can
+// be compared directly against the NilUUID sentinel without slicing.
 func (id UUID) IsNil() bool {
-	return bytes.Compare(id[:], NilUUID[:]) == 0
+	return id == NilUUID
 }
 
 // String converts UUID to its string representation.